@@ -12,6 +12,10 @@ from PyQt6.QtCore import QUrl, Qt, QStandardPaths, QDir
 from PyQt6.QtGui import QIcon, QAction, QKeySequence, QShortcut, QDesktopServices
 
 from .dialogs import AddSiteDialog, ConfirmDialog
+from .completion import install_completion_detector
+
+BADGE_PREFIX = "● "
+MAX_RECORDED_DURATIONS = 100
 
 # Subclass to capture JS console messages and print them
 class DebugWebEnginePage(QWebEnginePage):
@@ -45,6 +49,7 @@ class MainWindow(QMainWindow):
         app_name = QApplication.applicationName() if QApplication.applicationName() else "chAIt"
         self.persistent_dir_path = os.path.join(storage_location, f"{app_name}Profile")
         self.sites_file_path = os.path.join(storage_location, "sites.json")
+        self.durations_file_path = os.path.join(storage_location, "response_times.json")
 
         dir = QDir()
         if not dir.exists(storage_location):
@@ -53,6 +58,7 @@ class MainWindow(QMainWindow):
             dir.mkpath(self.persistent_dir_path)
 
         self.sites = self.load_sites()
+        self.response_durations = self.load_response_durations()
 
         self.web_views = {} # Dictionary to hold web views by tab index
 
@@ -109,6 +115,28 @@ class MainWindow(QMainWindow):
             print(f"Error saving sites to {self.sites_file_path}: {e}", file=sys.stderr)
             QMessageBox.warning(self, "Save Error", f"Could not save site list:\n{e}")
 
+    def load_response_durations(self):
+        """Loads recorded response durations (ms) per site name from the JSON file."""
+        if not os.path.exists(self.durations_file_path):
+            return {}
+        try:
+            with open(self.durations_file_path, 'r') as f:
+                durations = json.load(f)
+                if isinstance(durations, dict) and all(isinstance(v, list) for v in durations.values()):
+                    return durations
+                print(f"Warning: Invalid format in {self.durations_file_path}. Starting fresh.", file=sys.stderr)
+        except Exception as e:
+            print(f"Warning: Error loading response durations {self.durations_file_path}: {e}", file=sys.stderr)
+        return {}
+
+    def save_response_durations(self):
+        """Saves the recorded response durations to the JSON file."""
+        try:
+            with open(self.durations_file_path, 'w') as f:
+                json.dump(self.response_durations, f, indent=4)
+        except Exception as e:
+            print(f"Error saving response durations to {self.durations_file_path}: {e}", file=sys.stderr)
+
     def init_tray_icon(self):
         """Initializes the system tray icon and menu."""
         try:
@@ -146,6 +174,7 @@ class MainWindow(QMainWindow):
 
         self.tray_icon.setContextMenu(tray_menu)
         self.tray_icon.activated.connect(self.tray_icon_activated)
+        self.tray_icon.messageClicked.connect(self.show_window)
         self.tray_icon.show()
 
 
@@ -231,6 +260,7 @@ class MainWindow(QMainWindow):
             self.tab_widget.setCurrentIndex(0)
 
         main_layout.addWidget(self.tab_widget, 1)
+        self.tab_widget.currentChanged.connect(self.clear_tab_badge)
         # right-click context menu on tabs
         self.tab_widget.tabBar().setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.tab_widget.tabBar().customContextMenuRequested.connect(self.on_tab_context_menu)
@@ -298,9 +328,46 @@ class MainWindow(QMainWindow):
 
         web_view = QWebEngineView()
         web_view.setPage(web_page)
+        bridge = install_completion_detector(web_page)
+        bridge.finished.connect(lambda duration_ms: self.on_response_finished(web_view, duration_ms))
         web_view.setUrl(QUrl(url_str))
         return web_view
 
+    def on_response_finished(self, web_view, duration_ms):
+        """Records the response duration and notifies if the response finished out of view."""
+        index = self.tab_widget.indexOf(web_view)
+        if index < 0 or index >= len(self.sites):
+            return
+        name = self.sites[index]['name']
+        durations = self.response_durations.setdefault(name, [])
+        durations.append(duration_ms)
+        del durations[:-MAX_RECORDED_DURATIONS]
+        self.save_response_durations()
+
+        is_current = index == self.tab_widget.currentIndex()
+        if is_current and self.isVisible() and self.isActiveWindow():
+            return
+        if not is_current:
+            self.set_tab_badge(index)
+        if self.tray_icon:
+            self.tray_icon.showMessage(
+                "chAIt",
+                f"{name} finished responding ({duration_ms / 1000:.1f}s)",
+                QSystemTrayIcon.MessageIcon.Information,
+                5000
+            )
+
+    def set_tab_badge(self, index):
+        """Marks a tab as having an unseen finished response."""
+        text = self.tab_widget.tabText(index)
+        if not text.startswith(BADGE_PREFIX):
+            self.tab_widget.setTabText(index, BADGE_PREFIX + text)
+
+    def clear_tab_badge(self, index):
+        """Removes the finished-response badge from a tab once it is viewed."""
+        if 0 <= index < len(self.sites):
+            self.tab_widget.setTabText(index, self.sites[index]['name'])
+
     def refresh_current_tab(self):
         """Reloads the web view in the currently selected tab."""
         current_index = self.tab_widget.currentIndex()
@@ -0,0 +1,96 @@
+import json
+import sys
+from PyQt6.QtCore import QObject, QFile, QIODevice, pyqtSignal, pyqtSlot
+from PyQt6.QtWebChannel import QWebChannel
+from PyQt6.QtWebEngineCore import QWebEngineScript
+
+# Selector for the "stop generating" control each site shows while a response streams.
+# The response is considered finished when this element disappears again.
+STOP_BUTTON_SELECTORS = {
+    "chatgpt.com": 'button[data-testid="stop-button"]',
+    "claude.ai": 'button[aria-label="Stop response"]',
+    "gemini.google.com": 'button[aria-label="Stop response"]',
+}
+DEFAULT_STOP_BUTTON_SELECTOR = 'button[aria-label*="Stop" i], button[data-testid*="stop" i]'
+
+# Injected into the isolated application world so the page itself can't reach the bridge.
+# A MutationObserver re-checks the stop button at most every 250ms while the DOM changes;
+# nothing runs while the page is idle. setTimeout is used instead of requestAnimationFrame
+# because hidden tabs don't get animation frames.
+_DETECTOR_JS = """
+(function() {
+    if (window.__chaitCompletionDetector) return;
+    window.__chaitCompletionDetector = true;
+    var selectors = __SELECTORS__;
+    var selector = selectors[location.hostname] || __DEFAULT_SELECTOR__;
+    new QWebChannel(qt.webChannelTransport, function(channel) {
+        var bridge = channel.objects.chaitBridge;
+        var startedAt = null;
+        var scheduled = false;
+        function check() {
+            scheduled = false;
+            var streaming = document.querySelector(selector) !== null;
+            if (streaming && startedAt === null) {
+                startedAt = performance.now();
+            } else if (!streaming && startedAt !== null) {
+                var duration = Math.round(performance.now() - startedAt);
+                startedAt = null;
+                bridge.responseFinished(duration);
+            }
+        }
+        new MutationObserver(function() {
+            if (!scheduled) {
+                scheduled = true;
+                setTimeout(check, 250);
+            }
+        }).observe(document.body, { childList: true, subtree: true });
+        check();
+    });
+})();
+"""
+
+_qwebchannel_js = None
+
+def _load_qwebchannel_js():
+    """Reads Qt's bundled qwebchannel.js once and caches it."""
+    global _qwebchannel_js
+    if _qwebchannel_js is None:
+        qfile = QFile(":/qtwebchannel/qwebchannel.js")
+        if qfile.open(QIODevice.OpenModeFlag.ReadOnly):
+            _qwebchannel_js = bytes(qfile.readAll()).decode("utf-8")
+            qfile.close()
+        else:
+            print("Warning: Could not load qwebchannel.js; response notifications disabled.", file=sys.stderr)
+            _qwebchannel_js = ""
+    return _qwebchannel_js
+
+class CompletionBridge(QObject):
+    """Receives response-finished events from the detector script of one page."""
+    finished = pyqtSignal(int)
+
+    @pyqtSlot(int)
+    def responseFinished(self, duration_ms):
+        self.finished.emit(duration_ms)
+
+def install_completion_detector(web_page):
+    """Attaches a CompletionBridge and the detector script to `web_page` and returns the bridge."""
+    bridge = CompletionBridge(web_page)
+    qwebchannel_js = _load_qwebchannel_js()
+    if not qwebchannel_js:
+        return bridge
+
+    channel = QWebChannel(web_page)
+    channel.registerObject("chaitBridge", bridge)
+    web_page.setWebChannel(channel, QWebEngineScript.ScriptWorldId.ApplicationWorld)
+
+    detector_js = (_DETECTOR_JS
+                   .replace("__SELECTORS__", json.dumps(STOP_BUTTON_SELECTORS))
+                   .replace("__DEFAULT_SELECTOR__", json.dumps(DEFAULT_STOP_BUTTON_SELECTOR)))
+    script = QWebEngineScript()
+    script.setName("chaitCompletionDetector")
+    script.setSourceCode(qwebchannel_js + "\n" + detector_js)
+    script.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentReady)
+    script.setWorldId(QWebEngineScript.ScriptWorldId.ApplicationWorld)
+    script.setRunsOnSubFrames(False)
+    web_page.scripts().insert(script)
+    return bridge